@@ -1,38 +1,254 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import sys
 import io
-
-try:
-    from forms.mg1 import Mg1
-    from forms.mm import Mm
-    from forms.mm1k import Mm1k
-    from forms.mmsk import Mmsk
-    from forms.mm1n import Mm1n
-    from forms.mmsn import Mmsn
-    from forms.prioridadesInterrupcao import MMSPrioridadeComInterrupcaoModelo, mms_prioridade_com_interrupcao
-    from forms.prioridadesSemInterrup import MMSPrioridadeSemInterrupcaoModelo, mms_prioridade_sem_interrupcao
-    from ListaExercicios import rodar_testes
-except ImportError as e:
-    print("Erro crítico: Certifique-se de que 'formulas.py' e 'ListaExercicios.py' estão na mesma pasta.")
-    print(f"Detalhe: {e}")
-    sys.exit(1)
+import contextlib
+import re
+import importlib
+import threading
+import queue
+from functools import lru_cache
+
+# Modelos importados sob demanda (nome -> (módulo, atributo)): a janela abre
+# sem carregar forms.* e ListaExercicios; os imports saem do caminho de
+# inicialização e são aquecidos por pre_carregar em uma thread de fundo.
+_MODELOS = {
+    "Mg1": ("forms.mg1", "Mg1"),
+    "Mm": ("forms.mm", "Mm"),
+    "Mm1k": ("forms.mm1k", "Mm1k"),
+    "Mmsk": ("forms.mmsk", "Mmsk"),
+    "Mm1n": ("forms.mm1n", "Mm1n"),
+    "Mmsn": ("forms.mmsn", "Mmsn"),
+    "mms_prioridade_com_interrupcao": ("forms.prioridadesInterrupcao", "mms_prioridade_com_interrupcao"),
+    "mms_prioridade_sem_interrupcao": ("forms.prioridadesSemInterrup", "mms_prioridade_sem_interrupcao"),
+    "rodar_testes": ("ListaExercicios", "rodar_testes"),
+}
+
+@lru_cache(maxsize=None)
+def carregar(nome):
+    """Importa o módulo do modelo na primeira chamada e devolve a classe/função registrada."""
+    modulo, atributo = _MODELOS[nome]
+    return getattr(importlib.import_module(modulo), atributo)
+
+@lru_cache(maxsize=128)
+def instanciar(nome, **parametros):
+    """
+    Devolve o modelo 'nome' construído com os parâmetros dados, reaproveitando a
+    instância quando os mesmos parâmetros se repetem (ex.: só t ou n mudaram).
+    """
+    return carregar(nome)(**parametros)
+
+def pre_carregar():
+    """Aquece o cache de carregar() em segundo plano, sem atrasar a abertura da janela."""
+    for nome in _MODELOS:
+        carregar(nome)
+
+# Tabela de tradução criada uma única vez: aceita "0,5" como 0.5 nos campos numéricos
+_VIRGULA_PARA_PONTO = str.maketrans(",", ".")
+
+def ler_float(entry):
+    """Lê um campo numérico aceitando vírgula ou ponto como separador decimal."""
+    return float(entry.get().translate(_VIRGULA_PARA_PONTO))
+
+def ler_campos(entries, tipos):
+    """Lê vários campos de uma vez; tipos traz float (vírgula aceita) ou int para cada campo."""
+    return [ler_float(e) if tipo is float else tipo(e.get()) for e, tipo in zip(entries, tipos)]
+
+# Separadores de uma lista de taxas ("1.5, 2.0, 0.5"): vírgula, ponto e vírgula ou espaço
+_SEPARADORES_LISTA_RE = re.compile(r"[,;\s]+")
+
+# Validação por tecla: o campo recusa caracteres que não formam um número.
+# Estados parciais ("", "-", "0,") são aceitos enquanto o usuário digita.
+_FLOAT_PARCIAL_RE = re.compile(r"[-+]?\d*[.,]?\d*(?:[eE][-+]?\d*)?")
+_INT_PARCIAL_RE = re.compile(r"\d*")
+
+def _is_float(texto):
+    return _FLOAT_PARCIAL_RE.fullmatch(texto) is not None
+
+def _is_int(texto):
+    return _INT_PARCIAL_RE.fullmatch(texto) is not None
+
+def ler_lista_floats(entry):
+    """Lê um campo com várias taxas separadas por vírgula (ou espaço/ponto e vírgula)."""
+    # Cada trecho entre separadores precisa ser um número completo: "1.2.3" ou "2a"
+    # fazem float() levantar ValueError em vez de virarem taxas inventadas
+    valores = [float(t) for t in _SEPARADORES_LISTA_RE.split(entry.get()) if t]
+    if not valores:
+        raise ValueError("Informe ao menos uma taxa de chegada (ex: 1.5, 2.0, 0.5).")
+    return valores
 
 class TextRedirector(object):
-    """Classe utilitária para redirecionar o stdout (print) para um widget de Texto do Tkinter."""
+    """
+    Classe utilitária para redirecionar o stdout (print) para um widget de Texto do Tkinter.
+
+    As escritas são acumuladas em memória e inseridas no widget de uma só vez,
+    no máximo a cada INTERVALO_MS (~60 atualizações/s) ou quando flush() é chamado.
+    Trechos escritos com tags (ex.: ("erro",)) entram no mesmo insert, já marcados.
+    O widget guarda no máximo MAX_LINHAS linhas: as mais antigas são descartadas.
+    """
+    MAX_LINHAS = 5000
+    INTERVALO_MS = 16
+
     def __init__(self, widget):
         self.widget = widget
+        self._buf = []
+        self._agendado = False
+
+    def write(self, str_val, tags=()):
+        # _buf guarda pares ([trechos], tags); trechos seguidos com as mesmas tags são agrupados
+        if self._buf and self._buf[-1][1] == tags:
+            self._buf[-1][0].append(str_val)
+        else:
+            self._buf.append(([str_val], tags))
+        if not self._agendado:
+            self._agendado = True
+            self.widget.after(self.INTERVALO_MS, self._flush)
+
+    def _flush(self):
+        self._agendado = False
+        if not self._buf:
+            return
+        # Um único insert com os pares texto, tags: insert("end", t1, tags1, t2, tags2, ...)
+        args = []
+        for trechos, tags in self._buf:
+            args.append("".join(trechos))
+            args.append(tags)
+        self._buf.clear()
 
-    def write(self, str_val):
         self.widget.configure(state='normal')
-        self.widget.insert("end", str_val)
+        self.widget.insert("end", *args)
+        linhas = int(self.widget.index("end-1c").split(".")[0])
+        if linhas > self.MAX_LINHAS:
+            self.widget.delete("1.0", f"{linhas - self.MAX_LINHAS + 1}.0")
+        # Rolagem feita uma única vez por lote. Não chamar update() aqui (reentra
+        # no mainloop); se for preciso forçar o desenho, usar update_idletasks()
         self.widget.see("end")
         self.widget.configure(state='disabled')
+        self.widget.edit_modified(False)  # ninguém observa <<Modified>> neste widget
+
+    def flush(self):
+        self._flush()
+
+class QueueWriter(object):
+    """Objeto tipo arquivo que só enfileira o texto; quem escreve no widget é a thread do Tk."""
+    def __init__(self, fila):
+        self.fila = fila
+
+    def write(self, str_val):
+        self.fila.put(str_val)
 
     def flush(self):
         pass
 
+@lru_cache(maxsize=64)
+def relatorio_mg1(lam, mi, var):
+    """Relatório M/G/1 em texto; entradas já calculadas devolvem o texto em cache."""
+    saida = io.StringIO()
+    instanciar("Mg1", lam=lam, mi=mi, var=var).mg1_print(file=saida)
+    return saida.getvalue()
+
+# Linha separadora dos relatórios, criada uma única vez
+_SEPARADOR = "-" * 30
+
+@lru_cache(maxsize=128)
+def relatorio_mms(lam, mi, s, t_min, n_clientes):
+    """Relatório M/M/1 ou M/M/s, seguido de P(n), P(Wq > t) e P(W > t), com t em minutos."""
+    saida = io.StringIO()
+    t_horas = t_min / 60.0 # Converte t para horas
+
+    modelo = instanciar("Mm", lam=lam, mi=mi, s=s)
+
+    # Métricas básicas (L, Lq, W, Wq, P0, etc)
+    modelo.resultado(file=saida)
+
+    # Probabilidades: as linhas são montadas em lista e emitidas de uma só vez
+    linhas = [_SEPARADOR, "--- Cálculos de Probabilidade ---"]
+
+    # Pn
+    prob_n = modelo.prob_n_clientes(n=n_clientes)
+    linhas.append(f"P({n_clientes}) (Prob. de {n_clientes} clientes no sistema): {prob_n:.4f} ({prob_n*100:.2f}%)")
+
+    # P(Wq > t)
+    prob_wq = modelo.prob_wq_maior_que_t(t=t_horas)
+    linhas.append(f"P(Wq > {t_min:.2f} min) (Esperar na Fila): {prob_wq:.4f} ({prob_wq*100:.2f}%)")
+
+    # P(W > t)
+    if s == 1:
+        prob_w = modelo.prob_w_maior_que_t(t=t_horas)
+        linhas.append(f"P(W > {t_min:.2f} min) (Ficar no Sistema): {prob_w:.4f} ({prob_w*100:.2f}%)")
+    else:
+        linhas.append(f"P(W > {t_min:.2f} min) (Ficar no Sistema): Fórmula simplificada P(W>t) indisponível para M/M/{modelo.s} (s>1).")
+
+    linhas.append("")
+    saida.write("\n".join(linhas))
+    return saida.getvalue()
+
+@lru_cache(maxsize=128)
+def relatorio_capacidade_finita(lam, mi, s, k):
+    """Relatório M/M/1/K (s = 1) ou M/M/s/K."""
+    saida = io.StringIO()
+    if s == 1:
+        instanciar("Mm1k", lam=lam, mi=mi, k=k).resultado(file=saida)
+    else:
+        instanciar("Mmsk", lam=lam, mi=mi, s=s, k=k).resultado(file=saida)
+    return saida.getvalue()
+
+@lru_cache(maxsize=128)
+def relatorio_populacao_finita(lam_por_cliente, mi, s, n_pop):
+    """Relatório M/M/1/N (s = 1) ou M/M/s/N."""
+    saida = io.StringIO()
+    if s == 1:
+        instanciar("Mm1n", lam_por_cliente=lam_por_cliente, mi=mi, n_pop=n_pop).resultado(file=saida)
+    else:
+        instanciar("Mmsn", lam_por_cliente=lam_por_cliente, mi=mi, s=s, n_pop=n_pop).resultado(file=saida)
+    return saida.getvalue()
+
+@lru_cache(maxsize=128)
+def relatorio_prioridades(nome_modelo, titulo, lambdas_, mi, servidores):
+    """Relatório de um modelo com prioridades; lambdas_ é uma tupla (chave do cache)."""
+    resultados = carregar(nome_modelo)(lambdas_=list(lambdas_), mi=mi, servidores=servidores)
+    return formatar_prioridades(titulo, resultados) + "\n"
+
+def formatar_prioridades(titulo, resultados):
+    """Monta o relatório das classes de prioridade como um único texto."""
+    linhas = [f"\n--- {titulo} ---\n"]
+    if "Erro" in resultados:
+        linhas.append(f"ERRO: {resultados['Erro']}")
+        return "\n".join(linhas)
+
+    # As classes compartilham as mesmas chaves: limpa cada rótulo uma única vez
+    rotulos = {}
+    for classe, vals in resultados.items():
+        linhas.append(f"Classe: {classe.replace('Classe ', '')}")
+        for key, value in vals.items():
+            rotulo = rotulos.get(key)
+            if rotulo is None:
+                rotulo = rotulos[key] = key.strip()
+            linhas.append(f"    {rotulo} = {value}")
+        linhas.append(_SEPARADOR)
+    return "\n".join(linhas)
+
+# Sentinela que a thread auxiliar coloca na fila ao terminar sem erro
+_FIM_EXECUCAO = object()
+
 class FilaApp:
+    # Ordem fixa das abas (título, método construtor), definida uma única vez na classe
+    ABAS = (
+        ("M/M/s (Infinito)", "create_tab_mms"),
+        ("M/G/1 Simples", "create_tab_mg1"),
+        ("MMS Prioridade (Sem Interrupção)", "create_tab_mms_priority_nonpreemptive"),
+        ("MMS Prioridade (Interrupção)", "create_tab_mms_priority_preemptive"),
+        ("Capacidade Finita (K)", "create_tab_finite_k"),        # M/M/1/K e M/M/s/K
+        ("População Finita (N)", "create_tab_finite_n"),         # M/M/1/N e M/M/s/N
+        ("Resolver Lista Exercícios", "create_tab_lista_exercicios"),
+    )
+
+    # Erros aparecem em vermelho na área de resultados; True volta a abrir também o diálogo modal
+    DIALOGO_ERRO = False
+
+    # Esvaziamento da fila de saída das execuções em segundo plano
+    INTERVALO_FILA_MS = 30
+    MAX_ITENS_FILA = 500
+
     def __init__(self, root):
         self.root = root
         self.root.title("Calculadora de Teoria das Filas")
@@ -41,150 +257,217 @@ class FilaApp:
         # Estilo
         style = ttk.Style()
         style.theme_use('clam')
+
+        # Validadores dos campos numéricos, registrados no Tcl uma única vez
+        self._validadores = {
+            float: (root.register(_is_float), '%P'),
+            int: (root.register(_is_int), '%P'),
+        }
         
         # Container principal (Abas)
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(expand=True, fill='both', padx=10, pady=10)
+
+        # Área de resultados única, abaixo das abas e compartilhada por todas elas
+        self._redirectors = {}  # widget de texto -> TextRedirector reutilizado a cada clique
+        self.out_text = self.create_output_area(root)
         
-        # Criar as abas
-        self.create_tab_mms()
-        self.create_tab_mg1()
-        self.create_tab_mms_priority_nonpreemptive() # M/M/s Prioridade Sem Interrupção
-        self.create_tab_mms_priority_preemptive()    # M/M/s Prioridade Com Interrupção
-        self.create_tab_finite_k() # M/M/1/K e M/M/s/K
-        self.create_tab_finite_n() # M/M/1/N e M/M/s/N
-        self.create_tab_lista_exercicios()
+        # Criar as abas: cada uma começa como um quadro vazio e o conteúdo só é
+        # montado na primeira vez em que a aba é selecionada
+        self._abas_pendentes = {}
+        for texto, nome_aba in self.ABAS:
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=texto)
+            self._abas_pendentes[str(tab)] = (tab, nome_aba)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._montar_aba_selecionada)
+        self._montar_aba_selecionada()
+
+        # Com a janela pronta, os modelos são importados em uma thread auxiliar:
+        # quando o usuário clicar em "Calcular" eles provavelmente já estarão carregados
+        threading.Thread(target=pre_carregar, daemon=True).start()
+
+    def _montar_aba_selecionada(self, event=None):
+        """Monta o conteúdo da aba selecionada, apenas na primeira seleção."""
+        pendente = self._abas_pendentes.pop(str(self.notebook.select()), None)
+        if pendente is not None:
+            tab, nome_aba = pendente
+            getattr(self, nome_aba)(tab)
 
     def create_output_area(self, parent):
         """Cria uma área de texto scrollável para mostrar os resultados."""
         frame = ttk.LabelFrame(parent, text="Resultados", padding=10)
         frame.pack(side='bottom', expand=True, fill='both', padx=5, pady=5)
         
-        text_area = tk.Text(frame, height=10, state='disabled', font=("Consolas", 10))
+        # Área somente leitura: sem histórico de desfazer e sem quebra de linha
+        # (as linhas dos relatórios não são re-quebradas a cada inserção)
+        text_area = tk.Text(frame, height=10, state='disabled', font=("Consolas", 10),
+                            undo=False, autoseparators=False, maxundo=0, wrap='none')
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=text_area.yview)
-        text_area.configure(yscrollcommand=scrollbar.set)
+        scrollbar_x = ttk.Scrollbar(frame, orient="horizontal", command=text_area.xview)
+        text_area.configure(yscrollcommand=scrollbar.set, xscrollcommand=scrollbar_x.set)
+        text_area.tag_configure("erro", foreground="red")
         
         scrollbar.pack(side='right', fill='y')
+        scrollbar_x.pack(side='bottom', fill='x')
         text_area.pack(side='left', expand=True, fill='both')
         
         # Botão limpar
         btn_clean = ttk.Button(frame, text="Limpar Tela", command=lambda: self.clear_text(text_area))
         btn_clean.pack(side='top', anchor='ne', pady=2)
-        
+
+        self._redirectors[text_area] = TextRedirector(text_area)
         return text_area
 
+    def _build_form(self, parent, campos, linha_inicial=0):
+        """
+        Cria os pares rótulo/campo de um formulário em uma única passada.
+
+        campos: sequência de (rótulo, valor padrão[, tipo[, largura]]). O tipo
+        (float por padrão, int, ou None para texto livre) define a validação por tecla.
+        Devolve as Entries na mesma ordem dos campos.
+        """
+        entradas = []
+        for linha, campo in enumerate(campos, start=linha_inicial):
+            rotulo, padrao = campo[0], campo[1]
+            tipo = campo[2] if len(campo) > 2 else float
+            opcoes = {'width': campo[3]} if len(campo) > 3 else {}
+            if tipo is not None:
+                opcoes.update(validate='key', validatecommand=self._validadores[tipo])
+
+            ttk.Label(parent, text=rotulo).grid(row=linha, column=0, sticky='w', padx=5, pady=5)
+            ent = ttk.Entry(parent, **opcoes)
+            if padrao:
+                ent.insert(0, padrao)
+            ent.grid(row=linha, column=1, padx=5, pady=5)
+            entradas.append(ent)
+        return entradas
+
     def clear_text(self, text_widget):
         text_widget.configure(state='normal')
         text_widget.delete(1.0, tk.END)
         text_widget.configure(state='disabled')
 
     def capture_output(self, func, text_widget, *args):
-        """Executa uma função capturando seus prints para a widget de texto."""
-        old_stdout = sys.stdout
-        sys.stdout = TextRedirector(text_widget)
+        """
+        Executa func(saida, *args), onde saida é um buffer em memória que os
+        modelos recebem explicitamente (file=saida), e insere todo o relatório
+        no widget de texto de uma só vez. O sys.stdout global não é alterado.
+        """
+        saida = io.StringIO()
+        saida.write("\n>>> Calculando...\n")
+        erro = None
         try:
-            text_widget.configure(state='normal')
-            text_widget.insert(tk.END, "\n>>> Calculando...\n")
-            text_widget.configure(state='disabled')
-            func(*args)
+            func(saida, *args)
         except Exception as e:
-            text_widget.configure(state='normal')
-            text_widget.insert(tk.END, f"\nERRO: {str(e)}\n")
-            text_widget.configure(state='disabled')
-            messagebox.showerror("Erro no Cálculo", str(e))
-        finally:
-            sys.stdout = old_stdout
+            erro = e
+
+        redirector = self._redirectors[text_widget]
+        redirector.write(saida.getvalue())
+        if erro is not None:
+            self._mostrar_erro(redirector, erro)
+        redirector.flush()
+
+    def _mostrar_erro(self, redirector, erro):
+        """Mostra o erro destacado na área de resultados (e num diálogo, se DIALOGO_ERRO)."""
+        redirector.write(f"\nERRO: {str(erro)}\n", ("erro",))
+        if self.DIALOGO_ERRO:
+            redirector.flush()
+            messagebox.showerror("Erro no Cálculo", str(erro))
+
+    def run_in_background(self, func, text_widget, botao):
+        """
+        Executa func(progresso) em uma thread auxiliar, sem travar a janela. Os
+        prints e as chamadas progresso(feitos, total) vão para uma fila que a
+        thread do Tk esvazia a cada INTERVALO_FILA_MS; só ela toca nos widgets.
+        O botão fica desabilitado, mostrando o andamento, até o fim da execução.
+        """
+        fila = queue.Queue()
+        redirector = self._redirectors[text_widget]
+        redirector.write("\n>>> Calculando...\n")
+        texto_botao = botao.cget('text')
+        botao.configure(state='disabled')
+
+        def progresso(feitos, total):
+            fila.put((feitos, total))
+
+        def trabalho():
+            erro = None
+            try:
+                with contextlib.redirect_stdout(QueueWriter(fila)):
+                    func(progresso)
+            except Exception as e:
+                erro = e
+            finally:
+                fila.put(_FIM_EXECUCAO if erro is None else erro)
+
+        threading.Thread(target=trabalho, daemon=True).start()
+        self._drenar_fila(fila, redirector, botao, texto_botao)
+
+    def _drenar_fila(self, fila, redirector, botao, texto_botao):
+        """Passa para os widgets o que a thread já produziu e reagenda enquanto ela não terminar."""
+        fim = None
+        andamento = None
+        for _ in range(self.MAX_ITENS_FILA):
+            try:
+                item = fila.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                redirector.write(item)
+            elif isinstance(item, tuple):
+                andamento = item
+            else:
+                fim = item
+                break
+
+        if fim is None:
+            redirector.flush()
+            if andamento is not None:
+                botao.configure(text=f"{texto_botao} ({andamento[0]}/{andamento[1]})")
+            self.root.after(self.INTERVALO_FILA_MS, self._drenar_fila, fila, redirector, botao, texto_botao)
+            return
+
+        if fim is not _FIM_EXECUCAO:
+            self._mostrar_erro(redirector, fim)
+        redirector.flush()
+        botao.configure(state='normal', text=texto_botao)
 
     # --- ABA 1: M/M/1 e M/M/s ---
-    def create_tab_mms(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="M/M/s (Infinito)")
-        
+    def create_tab_mms(self, tab):
         # Inputs Frame
         input_frame = ttk.Frame(tab, padding=10)
         input_frame.pack(fill='x')
         
-        # Linha 0: Lambda
-        ttk.Label(input_frame, text="Taxa de Chegada (λ):").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        ent_lam = ttk.Entry(input_frame)
-        ent_lam.grid(row=0, column=1, padx=5, pady=5)
-        
-        # Linha 1: Mu
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.grid(row=1, column=1, padx=5, pady=5)
-        
-        # Linha 2: Servidores (s)
-        ttk.Label(input_frame, text="Número de Servidores (s):").grid(row=2, column=0, sticky='w', padx=5, pady=5)
-        ent_s = ttk.Entry(input_frame)
-        ent_s.insert(0, "1")
-        ent_s.grid(row=2, column=1, padx=5, pady=5)
+        ent_lam, ent_mi, ent_s = self._build_form(input_frame, [
+            ("Taxa de Chegada (λ):", ""),
+            ("Taxa de Atendimento (μ):", ""),
+            ("Número de Servidores (s):", "1", int),
+        ])
         
         ttk.Separator(input_frame, orient='horizontal').grid(row=3, column=0, columnspan=2, sticky='ew', pady=5)
 
-        # Linha 4: Tempo N para Probabilidade W>t e Wq>t
-        ttk.Label(input_frame, text="Tempo t (em Minutos) para P(W>t) e P(Wq>t):").grid(row=4, column=0, sticky='w', padx=5, pady=5)
-        ent_t_minutos = ttk.Entry(input_frame)
-        ent_t_minutos.insert(0, "60") 
-        ent_t_minutos.grid(row=4, column=1, padx=5, pady=5)
-        
-        # --- NOVO CAMPO ---
-        # Linha 5: Número n de clientes para Pn
-        ttk.Label(input_frame, text="Número n de Clientes para Pn:").grid(row=5, column=0, sticky='w', padx=5, pady=5)
-        ent_n_clientes = ttk.Entry(input_frame)
-        ent_n_clientes.insert(0, "5") # Exemplo: probabilidade de 5 clientes estarem no sistema
-        ent_n_clientes.grid(row=5, column=1, padx=5, pady=5)
-        # --- FIM NOVO CAMPO ---
-        
-        # Área de Output
-        out_text = self.create_output_area(tab)
+        # Linhas 4 e 5: tempo t para P(W>t)/P(Wq>t) e número n de clientes para Pn
+        ent_t_minutos, ent_n_clientes = self._build_form(input_frame, [
+            ("Tempo t (em Minutos) para P(W>t) e P(Wq>t):", "60"),
+            ("Número n de Clientes para Pn:", "5", int),  # Exemplo: probabilidade de 5 clientes estarem no sistema
+        ], linha_inicial=4)
         
-        def run():
+        def run(saida):
             # 1. Captura e validação de entradas
-            l = float(ent_lam.get())
-            m = float(ent_mi.get())
-            s = int(ent_s.get())
-            t_min = float(ent_t_minutos.get()) 
-            t_horas = t_min / 60.0 # Converte t para horas
-
-            # --- NOVO VALOR ---
-            n_clientes = int(ent_n_clientes.get())
-            # ------------------
-            
-            modelo = Mm(lam=l, mi=m, s=s)
-            
-            # 2. Imprime as métricas básicas (L, Lq, W, Wq, P0, etc)
-            modelo.resultado() 
-            
-            # 3. Imprime as probabilidades
-            print("-" * 30)
-            print("--- Cálculos de Probabilidade ---")
-            
-            # Pn
-            prob_n = modelo.prob_n_clientes(n=n_clientes)
-            print(f"P({n_clientes}) (Prob. de {n_clientes} clientes no sistema): {prob_n:.4f} ({prob_n*100:.2f}%)")
-
-            # P(Wq > t)
-            prob_wq = modelo.prob_wq_maior_que_t(t=t_horas)
-            print(f"P(Wq > {t_min:.2f} min) (Esperar na Fila): {prob_wq:.4f} ({prob_wq*100:.2f}%)")
-
-            # P(W > t)
-            if s == 1:
-                prob_w = modelo.prob_w_maior_que_t(t=t_horas)
-                print(f"P(W > {t_min:.2f} min) (Ficar no Sistema): {prob_w:.4f} ({prob_w*100:.2f}%)")
-            else:
-                print(f"P(W > {t_min:.2f} min) (Ficar no Sistema): Fórmula simplificada P(W>t) indisponível para M/M/{modelo.s} (s>1).")
+            l, m, s, t_min, n_clientes = ler_campos(
+                (ent_lam, ent_mi, ent_s, ent_t_minutos, ent_n_clientes),
+                (float, float, int, float, int),
+            )
 
+            # 2. Métricas e probabilidades; entradas repetidas vêm do cache
+            saida.write(relatorio_mms(l, m, s, t_min, n_clientes))
 
         # Botão Calcular
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=6, column=0, columnspan=2, pady=10)
+        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, self.out_text)).grid(row=6, column=0, columnspan=2, pady=10)
 
     # --- ABA 2: M/G/1 e Prioridades ---
-    def create_tab_mg1(self):
-        tab = ttk.Frame(self.notebook)
-        # Título alterado para foco apenas no M/G/1
-        self.notebook.add(tab, text="M/G/1 Simples")
-        
+    def create_tab_mg1(self, tab):
         input_frame = ttk.Frame(tab, padding=10)
         input_frame.pack(fill='x')
         
@@ -192,244 +475,105 @@ class FilaApp:
         
         ttk.Separator(input_frame, orient='horizontal').grid(row=1, column=0, columnspan=2, sticky='ew', pady=5)
 
-        # Campos de Entrada
-        # λ
-        ttk.Label(input_frame, text="Taxa de Chegada (λ):").grid(row=2, column=0, sticky='w')
-        ent_lam = ttk.Entry(input_frame)
-        ent_lam.insert(0, "8")
-        ent_lam.grid(row=2, column=1, padx=5, pady=2)
-
-        # μ
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=3, column=0, sticky='w')
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.insert(0, "10")
-        ent_mi.grid(row=3, column=1, padx=5, pady=2)
-
-        # Variância (σ²)
-        ttk.Label(input_frame, text="Variância (σ²):").grid(row=4, column=0, sticky='w')
-        ent_var = ttk.Entry(input_frame)
-        ent_var.insert(0, "0.005")
-        ent_var.grid(row=4, column=1, padx=5, pady=2)
+        # Campos de Entrada: λ, μ e variância (σ²)
+        ent_lam, ent_mi, ent_var = self._build_form(input_frame, [
+            ("Taxa de Chegada (λ):", "8"),
+            ("Taxa de Atendimento (μ):", "10"),
+            ("Variância (σ²):", "0.005"),
+        ], linha_inicial=2)
 
-        out_text = self.create_output_area(tab)
-
-        def run():
+        def run(saida):
             # Captura os três parâmetros necessários para M/G/1 Simples
-            lam = float(ent_lam.get())
-            mi = float(ent_mi.get())
-            var = float(ent_var.get())
+            lam, mi, var = ler_campos((ent_lam, ent_mi, ent_var), (float, float, float))
             
-            # Chama a classe Mg1 para M/G/1 simples (lam_list=None é o default)
-            modelo = Mg1(lam=lam, mi=mi, var=var)
-            modelo.mg1_print()
+            # M/G/1 simples (lam_list=None é o default); recliques com os mesmos valores vêm do cache
+            saida.write(relatorio_mg1(lam, mi, var))
             
         # O botão de cálculo agora está na linha 5
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=5, column=0, columnspan=2, pady=10)
-    
-    def create_tab_mms_priority_preemptive(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="MMS Prioridade (Interrupção)")
-        
-        input_frame = ttk.Frame(tab, padding=10)
-        input_frame.pack(fill='x')
-        
-        # 1. Input λi (Lista)
-        ttk.Label(input_frame, text="Taxas de Chegada (λi, separadas por vírgula):").grid(row=0, column=0, sticky='w')
-        ent_lambdas = ttk.Entry(input_frame, width=50)
-        ent_lambdas.insert(0, "1.5, 2.0, 0.5")
-        ent_lambdas.grid(row=0, column=1, padx=5, pady=5)
-        
-        # 2. Input μ
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=1, column=0, sticky='w')
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.insert(0, "4.0")
-        ent_mi.grid(row=1, column=1, padx=5, pady=5)
-        
-        # 3. Input s
-        ttk.Label(input_frame, text="Número de Servidores (s):").grid(row=2, column=0, sticky='w')
-        ent_s = ttk.Entry(input_frame)
-        ent_s.insert(0, "1")
-        ent_s.grid(row=2, column=1, padx=5, pady=5)
-        
-        out_text = self.create_output_area(tab)
-        
-        def run():
-            # A função de cálculo que você forneceu
-            resultados = mms_prioridade_com_interrupcao(
-                lambdas_=[
-                    float(x.strip())
-                    for x in ent_lambdas.get().split(',')
-                    if x.strip()
-                ],
-                mi=float(ent_mi.get()),
-                servidores=int(ent_s.get())
-            )
-            
-            # Formata e printa os resultados no console/widget
-            print("\n--- Resultados MMS Prioridade com Interrupção ---\n")
-            for classe, vals in resultados.items():
-                if classe == "Erro":
-                    print(f"ERRO: {vals}")
-                    return
-                print(f"Classe: {classe.replace('Classe ', '')}")
-                for key, value in vals.items():
-                    print(f"    {key.strip()} = {value}")
-                print("-" * 30)
-
-
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=3, column=0, columnspan=2, pady=10)
+        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, self.out_text)).grid(row=5, column=0, columnspan=2, pady=10)
     
-    def create_tab_mms_priority_nonpreemptive(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="MMS Prioridade (Sem Interrupção)")
-        
+    def create_tab_mms_priority_preemptive(self, tab):
+        self._create_tab_priority(tab, "mms_prioridade_com_interrupcao",
+                                  "Resultados MMS Prioridade com Interrupção", servidores_padrao="1")
+
+    def create_tab_mms_priority_nonpreemptive(self, tab):
+        self._create_tab_priority(tab, "mms_prioridade_sem_interrupcao",
+                                  "Resultados MMS Prioridade Sem Interrupção", servidores_padrao="2")
+
+    def _create_tab_priority(self, tab, nome_modelo, titulo_resultado, servidores_padrao):
+        """Aba dos modelos M/M/s com prioridades; com e sem interrupção diferem só no modelo."""
         input_frame = ttk.Frame(tab, padding=10)
         input_frame.pack(fill='x')
         
-        # 1. Input λi (Lista)
-        ttk.Label(input_frame, text="Taxas de Chegada (λi, separadas por vírgula):").grid(row=0, column=0, sticky='w')
-        ent_lambdas = ttk.Entry(input_frame, width=50)
-        ent_lambdas.insert(0, "1.5, 2.0, 0.5")
-        ent_lambdas.grid(row=0, column=1, padx=5, pady=5)
-        
-        # 2. Input μ
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=1, column=0, sticky='w')
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.insert(0, "4.0")
-        ent_mi.grid(row=1, column=1, padx=5, pady=5)
-        
-        # 3. Input s
-        ttk.Label(input_frame, text="Número de Servidores (s):").grid(row=2, column=0, sticky='w')
-        ent_s = ttk.Entry(input_frame)
-        ent_s.insert(0, "2")
-        ent_s.grid(row=2, column=1, padx=5, pady=5)
-        
-        out_text = self.create_output_area(tab)
-        
-        def run():
-            # A função de cálculo que você forneceu
-            lambdas_input = [
-                float(x.strip())
-                for x in ent_lambdas.get().split(',')
-                if x.strip()
-            ]
-            
-            resultados = mms_prioridade_sem_interrupcao(
-                lambdas_=lambdas_input,
-                mi=float(ent_mi.get()),
-                servidores=int(ent_s.get())
-            )
-            
-            # Formata e printa os resultados no console/widget
-            print("\n--- Resultados MMS Prioridade Sem Interrupção ---\n")
-            for classe, vals in resultados.items():
-                if classe == "Erro":
-                    print(f"ERRO: {vals}")
-                    return
-                print(f"Classe: {classe.replace('Classe ', '')}")
-                for key, value in vals.items():
-                    print(f"    {key.strip()} = {value}")
-                print("-" * 30)
-
-
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=3, column=0, columnspan=2, pady=10)
+        ent_lambdas, ent_mi, ent_s = self._build_form(input_frame, [
+            ("Taxas de Chegada (λi, separadas por vírgula):", "1.5, 2.0, 0.5", None, 50),
+            ("Taxa de Atendimento (μ):", "4.0"),
+            ("Número de Servidores (s):", servidores_padrao, int),
+        ])
+        
+        def run(saida):
+            # Formata os resultados para o widget; entradas repetidas vêm do cache
+            mi, servidores = ler_campos((ent_mi, ent_s), (float, int))
+            saida.write(relatorio_prioridades(
+                nome_modelo,
+                titulo_resultado,
+                tuple(ler_lista_floats(ent_lambdas)),
+                mi,
+                servidores,
+            ))
+
+        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, self.out_text)).grid(row=3, column=0, columnspan=2, pady=10)
 
     # --- ABA 3: Fila Finita (K) ---
-    def create_tab_finite_k(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Capacidade Finita (K)")
-        
+    def create_tab_finite_k(self, tab):
         input_frame = ttk.Frame(tab, padding=10)
         input_frame.pack(fill='x')
         
-        ttk.Label(input_frame, text="Taxa de Chegada (λ):").grid(row=0, column=0, sticky='w')
-        ent_lam = ttk.Entry(input_frame)
-        ent_lam.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=1, column=0, sticky='w')
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(input_frame, text="Número de Servidores (s):").grid(row=2, column=0, sticky='w')
-        ent_s = ttk.Entry(input_frame)
-        ent_s.insert(0, "1")
-        ent_s.grid(row=2, column=1, padx=5, pady=5)
-
-        ttk.Label(input_frame, text="Capacidade do Sistema (K):").grid(row=3, column=0, sticky='w')
-        ent_k = ttk.Entry(input_frame)
-        ent_k.grid(row=3, column=1, padx=5, pady=5)
+        ent_lam, ent_mi, ent_s, ent_k = self._build_form(input_frame, [
+            ("Taxa de Chegada (λ):", ""),
+            ("Taxa de Atendimento (μ):", ""),
+            ("Número de Servidores (s):", "1", int),
+            ("Capacidade do Sistema (K):", "", int),
+        ])
         
-        out_text = self.create_output_area(tab)
-        
-        def run():
-            l = float(ent_lam.get())
-            m = float(ent_mi.get())
-            s = int(ent_s.get())
-            k = int(ent_k.get())
+        def run(saida):
+            l, m, s, k = ler_campos((ent_lam, ent_mi, ent_s, ent_k), (float, float, int, int))
             
-            if s == 1:
-                modelo = Mm1k(lam=l, mi=m, k=k)
-                modelo.resultado()
-            else:
-                modelo = Mmsk(lam=l, mi=m, s=s, k=k)
-                modelo.resultado()
+            saida.write(relatorio_capacidade_finita(l, m, s, k))
 
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=4, column=0, columnspan=2, pady=10)
+        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, self.out_text)).grid(row=4, column=0, columnspan=2, pady=10)
 
     # --- ABA 4: População Finita (N) ---
-    def create_tab_finite_n(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="População Finita (N)")
-        
+    def create_tab_finite_n(self, tab):
         input_frame = ttk.Frame(tab, padding=10)
         input_frame.pack(fill='x')
         
-        ttk.Label(input_frame, text="λ por cliente:").grid(row=0, column=0, sticky='w')
-        ent_lam = ttk.Entry(input_frame)
-        ent_lam.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(input_frame, text="Taxa de Atendimento (μ):").grid(row=1, column=0, sticky='w')
-        ent_mi = ttk.Entry(input_frame)
-        ent_mi.grid(row=1, column=1, padx=5, pady=5)
+        ent_lam, ent_mi, ent_s, ent_n = self._build_form(input_frame, [
+            ("λ por cliente:", ""),
+            ("Taxa de Atendimento (μ):", ""),
+            ("Número de Servidores (s):", "1", int),
+            ("Tamanho da População (N):", "", int),
+        ])
         
-        ttk.Label(input_frame, text="Número de Servidores (s):").grid(row=2, column=0, sticky='w')
-        ent_s = ttk.Entry(input_frame)
-        ent_s.insert(0, "1")
-        ent_s.grid(row=2, column=1, padx=5, pady=5)
-
-        ttk.Label(input_frame, text="Tamanho da População (N):").grid(row=3, column=0, sticky='w')
-        ent_n = ttk.Entry(input_frame)
-        ent_n.grid(row=3, column=1, padx=5, pady=5)
-        
-        out_text = self.create_output_area(tab)
-        
-        def run():
-            l = float(ent_lam.get())
-            m = float(ent_mi.get())
-            s = int(ent_s.get())
-            n_pop = int(ent_n.get())
+        def run(saida):
+            l, m, s, n_pop = ler_campos((ent_lam, ent_mi, ent_s, ent_n), (float, float, int, int))
             
-            if s == 1:
-                modelo = Mm1n(lam_por_cliente=l, mi=m, n_pop=n_pop)
-                modelo.resultado()
-            else:
-                modelo = Mmsn(lam_por_cliente=l, mi=m, s=s, n_pop=n_pop)
-                modelo.resultado()
+            saida.write(relatorio_populacao_finita(l, m, s, n_pop))
 
-        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, out_text)).grid(row=4, column=0, columnspan=2, pady=10)
+        ttk.Button(input_frame, text="Calcular", command=lambda: self.capture_output(run, self.out_text)).grid(row=4, column=0, columnspan=2, pady=10)
 
     # --- ABA 5: Resolver Lista ---
-    def create_tab_lista_exercicios(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Resolver Lista Exercícios")
-        
+    def create_tab_lista_exercicios(self, tab):
         desc = ttk.Label(tab, text="Esta função executa os testes definidos em 'ListaExercicios.py'\ne exibe os resultados abaixo.", justify="center", padding=20)
         desc.pack()
         
-        out_text = self.create_output_area(tab)
+        # ListaExercicios imprime no stdout; roda em segundo plano para não congelar a janela
+        def run(progresso):
+            carregar("rodar_testes")(progresso=progresso)
         
         # Botão Grande para rodar a lista
-        btn_run_list = ttk.Button(tab, text="RODAR LISTA DE EXERCÍCIOS", command=lambda: self.capture_output(rodar_testes, out_text))
+        btn_run_list = ttk.Button(tab, text="RODAR LISTA DE EXERCÍCIOS",
+                                  command=lambda: self.run_in_background(run, self.out_text, btn_run_list))
         btn_run_list.pack(pady=10, ipadx=20, ipady=10)
     
     
@@ -1,5 +1,4 @@
-import math
-from math import factorial
+from itertools import accumulate
 
 class Mg1:
     """
@@ -41,8 +40,11 @@ class Mg1:
         if self.var < 0:
             raise ValueError("var (variância do tempo de atendimento, σ²) não pode ser negativa.")
             
+        # E[S] = 1/μ, usado em todas as fórmulas de W
+        self.e_s = 1 / self.mi
+
         # Calcula E[S²] = Var[S] + E[S]² = σ² + (1/μ)²
-        self.e_s2 = self.var + math.pow(1 / self.mi, 2)
+        self.e_s2 = self.var + self.e_s * self.e_s
 
         if lam_list and len(lam_list) > 1:  # Modelo com prioridades
             self.lam_list = lam_list
@@ -61,6 +63,11 @@ class Mg1:
 
         self.interrupt = interrupt
 
+        # Resultados de mg1() e mg1_prioridades_nao_preemptivo(), calculados na
+        # primeira chamada (os parâmetros do modelo não mudam após o __init__)
+        self._metricas = None
+        self._metricas_prioridades = None
+
     def mg1(self):
         """
         Calcula as métricas do modelo M/G/1 (sem prioridades).
@@ -69,10 +76,13 @@ class Mg1:
         Retorna:
         tuple: (rho, L, Lq, W, Wq, P0)
         """
+        if self._metricas is not None:
+            return self._metricas
+
         p0 = 1 - self.rho
         
         # Lq = (λ² * E[S²]) / [2 * (1 - ρ)]
-        lq = (math.pow(self.lam, 2) * self.e_s2) / (2 * (1 - self.rho))
+        lq = (self.lam * self.lam * self.e_s2) / (2 * (1 - self.rho))
         
         # L = ρ + Lq 
         l = self.rho + lq
@@ -81,9 +91,10 @@ class Mg1:
         wq = lq / self.lam if self.lam != 0 else 0.0
         
         # W = Wq + E[S] = Wq + (1 / μ) 
-        w = wq + (1 / self.mi)
+        w = wq + self.e_s
         
-        return self.rho, l, lq, w, wq, p0
+        self._metricas = (self.rho, l, lq, w, wq, p0)
+        return self._metricas
 
     def mg1_prioridades_nao_preemptivo(self):
         """
@@ -96,21 +107,19 @@ class Mg1:
         """
         if self.lam_list is None:
             raise ValueError("lam_list deve ser fornecido para calcular prioridades.")
+        if self._metricas_prioridades is not None:
+            return list(self._metricas_prioridades)
 
         resultados = []
         
         # A = Σ [λ_i * E(S_i²)] -> A = E[S²] * Σ(λ_i) = E[S²] * self.lam
         a = self.lam * self.e_s2
         
-        r_sum_anterior = 0.0  # R_{k-1} = Σ_{i=1}^{k-1} ρ_i. R_0 = 0.
+        # R_k = Σ_{i=1}^{k} ρ_i para todas as classes de uma vez; R_0 = 0
+        r_acumulados = list(accumulate(self.rho_list, initial=0.0))
         
-        for i in range(len(self.lam_list)):
-            lam_k = self.lam_list[i]
-            rho_k = self.rho_list[i]
-            
-            # R_k = Σ_{i=1}^{k} ρ_i
-            r_sum_atual = r_sum_anterior + rho_k
-            
+        for lam_k, rho_k, r_sum_anterior, r_sum_atual in zip(
+                self.lam_list, self.rho_list, r_acumulados, r_acumulados[1:]):
             # Wq_k = A / [2 * (1 - R_{k-1}) * (1 - R_k)]
             denominador = 2 * (1 - r_sum_anterior) * (1 - r_sum_atual)
             
@@ -122,62 +131,68 @@ class Mg1:
                 l_k = float('inf')
             else:
                 wq_k = a / denominador
-                w_k = wq_k + (1 / self.mi) # W = Wq + E(S)
+                w_k = wq_k + self.e_s      # W = Wq + E(S)
                 lq_k = lam_k * wq_k          # Lq = λ * Wq
                 l_k = lam_k * w_k            # L = λ * W
                 
             resultados.append((lq_k, l_k, wq_k, w_k, rho_k))
             
-            r_sum_anterior = r_sum_atual # Atualiza R_{k-1} para a próxima iteração
-            
+        self._metricas_prioridades = tuple(resultados)
         return resultados
 
-    def mg1_print(self):
+    def mg1_print(self, file=None):
         """
         Exibe os resultados do modelo M/G/1 formatados no console.
         
-        Nota: Esta versão redireciona a saída para o widget Text usando a classe utilitária.
+        Nota: no App Tkinter, 'capture_output' passa um buffer em file e insere
+        o relatório inteiro no widget Text de uma só vez.
         """
-        # A captura de saída é feita pela função wrapper 'capture_output' no App Tkinter.
         
         if self.lam_list is None:  # Se não for modelo com prioridades
             try:
                 rho, l, lq, w, wq, p0 = self.mg1()
-                print(f"--- Modelo M/G/1 (Sem Prioridades) ---")
-                print(f"Taxa de chegada (λ): {self.lam:.4f}")
-                print(f"Taxa de atendimento (μ): {self.mi:.4f}")
-                print(f"Variância do tempo de atendimento (σ²): {self.var:.4f}")
-                print(f"E[S²] (Momento de 2ª ordem): {self.e_s2:.4f}")
-                print(f"----------------------------------------")
-                print(f"Taxa de utilização (ρ): {rho:.4f} ({(rho*100):.2f}%)")
-                print(f"Probabilidade de sistema vazio (P0): {p0:.4f} ({(p0*100):.2f}%)")
-                print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-                print(f"Número médio de clientes no sistema (L): {l:.4f}")
-                print(f"Tempo médio de espera na fila (Wq): {wq:.4f}")
-                print(f"Tempo médio no sistema (W): {w:.4f}")
+                linhas = [
+                    f"--- Modelo M/G/1 (Sem Prioridades) ---",
+                    f"Taxa de chegada (λ): {self.lam:.4f}",
+                    f"Taxa de atendimento (μ): {self.mi:.4f}",
+                    f"Variância do tempo de atendimento (σ²): {self.var:.4f}",
+                    f"E[S²] (Momento de 2ª ordem): {self.e_s2:.4f}",
+                    f"----------------------------------------",
+                    f"Taxa de utilização (ρ): {rho:.4f} ({(rho*100):.2f}%)",
+                    f"Probabilidade de sistema vazio (P0): {p0:.4f} ({(p0*100):.2f}%)",
+                    f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                    f"Número médio de clientes no sistema (L): {l:.4f}",
+                    f"Tempo médio de espera na fila (Wq): {wq:.4f}",
+                    f"Tempo médio no sistema (W): {w:.4f}",
+                ]
+                print("\n".join(linhas), file=file)
             except ValueError as e:
-                # O wrapper capture_output já lida com o erro, mas printamos para o TextRedirector
-                print(f"ERRO: {e}")
+                # O wrapper capture_output já lida com o erro, mas registramos no relatório
+                print(f"ERRO: {e}", file=file)
             
         else:  # Se for modelo com prioridades
             if self.interrupt:
-                print(f"--- Modelo M/G/1 com Prioridades (COM Interrupção) ---")
-                print("AVISO: O cálculo para M/G/1 com prioridades PREEMPTIVAS (com interrupção)")
-                print("       NÃO é fornecido por este método. As fórmulas M/G/1 Non-Preemptive serão usadas.")
+                print(f"--- Modelo M/G/1 com Prioridades (COM Interrupção) ---", file=file)
+                print("AVISO: O cálculo para M/G/1 com prioridades PREEMPTIVAS (com interrupção)", file=file)
+                print("       NÃO é fornecido por este método. As fórmulas M/G/1 Non-Preemptive serão usadas.", file=file)
             
             try:
-                print(f"--- Modelo M/G/1 com Prioridades (SEM Interrupção) ---")
-                print(f"Taxa de utilização TOTAL (ρ_total): {self.rho:.4f} ({(self.rho*100):.2f}%)")
-                print(f"E[S²] (Momento de 2ª ordem): {self.e_s2:.4f}")
+                print(f"--- Modelo M/G/1 com Prioridades (SEM Interrupção) ---", file=file)
+                print(f"Taxa de utilização TOTAL (ρ_total): {self.rho:.4f} ({(self.rho*100):.2f}%)", file=file)
+                print(f"E[S²] (Momento de 2ª ordem): {self.e_s2:.4f}", file=file)
                 
                 resultados = self.mg1_prioridades_nao_preemptivo()
                 
                 if resultados:
+                    linhas = []
                     for i, (lq_k, l, wq, w, rho_k) in enumerate(resultados):
-                        print(f"\nPrioridade {i+1} (λ_{i+1} = {self.lam_list[i]}, ρ_{i+1} = {rho_k:.4f}):")
-                        print(f"  Número médio na fila (Lq_{i+1}): {lq_k:.4f}")
-                        print(f"  Número médio no sistema (L_{i+1}): {l:.4f}")
-                        print(f"  Tempo médio na fila (Wq_{i+1}): {wq:.4f}")
-                        print(f"  Tempo médio no sistema (W_{i+1}): {w:.4f}")
+                        linhas += [
+                            f"\nPrioridade {i+1} (λ_{i+1} = {self.lam_list[i]}, ρ_{i+1} = {rho_k:.4f}):",
+                            f"  Número médio na fila (Lq_{i+1}): {lq_k:.4f}",
+                            f"  Número médio no sistema (L_{i+1}): {l:.4f}",
+                            f"  Tempo médio na fila (Wq_{i+1}): {wq:.4f}",
+                            f"  Tempo médio no sistema (W_{i+1}): {w:.4f}",
+                        ]
+                    print("\n".join(linhas), file=file)
             except ValueError as e:
-                print(f"ERRO: {e}")
\ No newline at end of file
+                print(f"ERRO: {e}", file=file)
\ No newline at end of file
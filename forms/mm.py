@@ -1,5 +1,4 @@
 import math
-from math import factorial
 
 class Mm:
     # ... (Métodos __init__, mm1, mms permanecem como no código anterior) ...
@@ -16,44 +15,83 @@ class Mm:
         if s <= 0 or not isinstance(s, int):
             raise ValueError("O número de servidores (s) deve ser um inteiro positivo.")
 
-        self.rho = self.lam / (self.mi * self.s)
+        self.r = self.lam / self.mi  # Razão r = (λ/μ), fixa após o __init__
+        self.rho = self.r / self.s
 
         if self.rho >= 1:
             raise ValueError(f"O sistema está instável (ρ = {self.rho:.4f} >= 1). Ajuste as taxas ou o número de servidores.")
 
+        # P0, log(P0) e P0 * r^s / s! do M/M/s, calculados na primeira chamada de _calc_p0
+        self._p0 = None
+        self._log_p0 = None
+        self._p0_r_s_fat = None
+        # (coeficiente, taxa) de P(Wq > t) = coeficiente * e^(-taxa * t)
+        self._cauda_wq = None
+
     def mm1(self) -> tuple[float, float, float, float, float]:
         """Calcula as métricas de desempenho para o Modelo M/M/1 (s=1)."""
-        rho1 = self.lam / self.mi
-        
-        p0 = 1 - rho1
+        p0 = 1 - self.r
         l = self.lam / (self.mi - self.lam)
-        lq = math.pow(self.lam, 2) / (self.mi * (self.mi - self.lam))
+        lq = self.lam * self.lam / (self.mi * (self.mi - self.lam))
         w = 1 / (self.mi - self.lam)
         wq = self.lam / (self.mi * (self.mi - self.lam))
         
         return p0, l, lq, w, wq
 
+    def _calc_p0(self) -> float:
+        """
+        P0 do M/M/s, calculado uma única vez por instância (mms e prob_n_clientes
+        reutilizam o valor). Guarda também o produto P0 * r^s / s! em
+        self._p0_r_s_fat.
+
+        Usa a recursão de Erlang B, B(m) = r*B(m-1) / (m + r*B(m-1)), que fica
+        sempre em [0, 1]: r^s/s! e a soma Σ r^n/n! estouram para s grande, mas
+        com E = B(s):
+            P0 * r^s / s! = E * (1 - ρ) / (1 - ρ * (1 - E))
+        e P0 sai desse produto dividido por r^s / s! (em escala logarítmica).
+        log(P0) fica guardado em self._log_p0: continua finito quando P0 é
+        menor que o menor float.
+        """
+        if self._p0 is None:
+            r = self.r
+
+            if r == 0:
+                # Sem chegadas: sistema sempre vazio
+                self._p0 = 1.0
+                self._log_p0 = 0.0
+                self._p0_r_s_fat = 0.0
+                return self._p0
+
+            erlang_b = 1.0
+            for m in range(1, self.s + 1):
+                erlang_b = r * erlang_b / (m + r * erlang_b)
+
+            self._p0_r_s_fat = erlang_b * (1 - self.rho) / (1 - self.rho * (1 - erlang_b))
+            if self._p0_r_s_fat > 0:
+                log_r_s_fat = self.s * math.log(r) - math.lgamma(self.s + 1)
+                self._log_p0 = math.log(self._p0_r_s_fat) - log_r_s_fat
+            else:
+                # B(s) abaixo do menor float: r^s/s! é desprezível diante da soma
+                # e P0 = 1 / Σ r^n/n! coincide com e^-r na precisão de ponto flutuante
+                self._log_p0 = -r
+            self._p0 = math.exp(self._log_p0)
+        return self._p0
+
     def mms(self) -> tuple[float, float, float, float, float]:
         """Calcula as métricas de desempenho para o Modelo M/M/s (s > 1)."""
-        r = self.lam / self.mi  # Razão r = (λ/μ)
-        
         # --- Cálculo de P0 ---
-        soma_p0 = 0.0
-        for n in range(self.s):
-            soma_p0 += (math.pow(r, n) / math.factorial(n))
-            
-        termo_s = (math.pow(r, self.s) / math.factorial(self.s)) * (1 / (1 - self.rho))
-        p0 = 1 / (soma_p0 + termo_s)
+        p0 = self._calc_p0()
         
         # --- Cálculo de Lq ---
-        numerador_lq = p0 * math.pow(r, self.s) * self.rho
-        denominador_lq = math.factorial(self.s) * math.pow(1 - self.rho, 2)
+        numerador_lq = self._p0_r_s_fat * self.rho
+        um_menos_rho = 1 - self.rho
+        denominador_lq = um_menos_rho * um_menos_rho
         lq = numerador_lq / denominador_lq
         
         # --- Outras métricas ---
         wq = lq / self.lam
         w = wq + (1 / self.mi)
-        l = lq + r
+        l = lq + self.r
         
         return p0, l, lq, w, wq
 
@@ -65,31 +103,61 @@ class Mm:
         if n < 0:
             return 0.0
 
-        # Obter P0. Se s=1, usa mm1; se s>1, usa mms.
+        # Obter P0. Se s=1, P0 = 1 - ρ; se s>1, vem do cache de _calc_p0.
         if self.s == 1:
-            p0, _, _, _, _ = self.mm1()
+            p0 = 1 - self.r
             # Fórmula M/M/1: Pn = ρ^n * P0
             if n == 0:
                 return p0
             return math.pow(self.rho, n) * p0
         else: # M/M/s
-            p0, _, _, _, _ = self.mms()
-            r = self.lam / self.mi # r = λ/μ
+            p0 = self._calc_p0()
             
             if n < self.s:
                 # Se n < s: Pn = (r^n / n!) * P0
-                return (math.pow(r, n) / math.factorial(n)) * p0
+                # Em escala logarítmica: r^n / n! estoura e P0 vai a zero para r grande,
+                # e o produto direto daria inf * 0 = nan
+                if self.r == 0:
+                    return p0 if n == 0 else 0.0
+                return math.exp(self._log_p0 + n * math.log(self.r) - math.lgamma(n + 1))
             else:
                 # Se n >= s: Pn = (r^s / s! * ρ^(n-s)) * P0
                 # Onde ρ = λ/(sμ)
                 
-                # Termo de Pn = (r^s / s!)
-                termo_s = math.pow(r, self.s) / math.factorial(self.s)
+                # Termo de Pn = (r^s / s!) * P0, já calculado junto com P0
+                termo_s = self._p0_r_s_fat
                 
                 # Termo de ρ^(n-s)
                 fator_rho = math.pow(self.rho, n - self.s)
                 
-                return termo_s * fator_rho * p0
+                return termo_s * fator_rho
+
+    def distribuicao_n_clientes(self, n_max: int) -> list[float]:
+        """
+        Calcula [P0, P1, ..., Pn_max] de uma só vez.
+
+        Usa a recorrência Pn = P(n-1) * r / min(n, s), que vale para M/M/1 e M/M/s:
+        cada termo sai do vizinho com uma multiplicação, sem potências nem fatoriais
+        (mais barato que chamar prob_n_clientes para cada n).
+
+        A varredura parte da moda da distribuição, n = ⌊r⌋ (< s), calculada por
+        prob_n_clientes, e segue para os dois lados: os termos só diminuem a partir
+        dela, então nada estoura e P0 subnormal (r grande) não zera a distribuição.
+        """
+        if n_max < 0:
+            return []
+
+        ancora = min(int(self.r), n_max)
+        probs = [0.0] * (n_max + 1)
+        probs[ancora] = self.prob_n_clientes(ancora)
+
+        # Abaixo da moda (n < s): P(n-1) = Pn * n / r
+        for n in range(ancora, 0, -1):
+            probs[n - 1] = probs[n] * n / self.r
+        # Acima da moda: Pn = P(n-1) * r / min(n, s)
+        for n in range(ancora + 1, n_max + 1):
+            probs[n] = probs[n - 1] * self.r / min(n, self.s)
+        return probs
 
     def prob_wq_maior_que_t(self, t: float) -> float:
         """
@@ -98,17 +166,20 @@ class Mm:
         if self.rho >= 1:
             return 1.0
             
-        if self.s == 1: 
-            # Fórmula M/M/1: P(Wq > t) = ρ * e^-(μ - λ)t
-            rho1 = self.lam / self.mi
-            return rho1 * math.exp(-(self.mi - self.lam) * t)
-        else:
-            # Fórmula M/M/s: P(Wq > t) = P(Wq > 0) * e^-(sμ(1-ρ)t)
-            p0, _, lq, _, _ = self.mms()
-            r = self.lam / self.mi
-            pwq0 = lq / r
-            
-            return pwq0 * math.exp(-(self.mi * self.s * (1 - self.rho)) * t)
+        # Coeficiente e taxa de decaimento não dependem de t: calculados uma vez
+        if self._cauda_wq is None:
+            if self.s == 1: 
+                # Fórmula M/M/1: P(Wq > t) = ρ * e^-(μ - λ)t
+                self._cauda_wq = (self.r, self.mi - self.lam)
+            else:
+                # Fórmula M/M/s: P(Wq > t) = P(Wq > 0) * e^-(sμ(1-ρ)t)
+                # P(Wq > 0) é o Erlang C: C = P0 * (r^s / s!) / (1 - ρ)
+                self._calc_p0()
+                pwq0 = self._p0_r_s_fat / (1 - self.rho)
+                self._cauda_wq = (pwq0, self.mi * self.s * (1 - self.rho))
+
+        coeficiente, taxa = self._cauda_wq
+        return coeficiente * math.exp(-taxa * t)
 
     def prob_w_maior_que_t(self, t: float) -> float:
         """
@@ -123,8 +194,8 @@ class Mm:
             
         return math.exp(-(self.mi - self.lam) * t)
 
-    def resultado(self):
-        """Exibe os resultados formatados no console."""
+    def resultado(self, file=None):
+        """Exibe os resultados formatados no console (ou em file, se informado)."""
         try:
             if self.s == 1:
                 p0, l, lq, w, wq = self.mm1()
@@ -133,16 +204,19 @@ class Mm:
                 p0, l, lq, w, wq = self.mms()
                 modelo = f"M/M/{self.s}"
             
-            print(f"--- Modelo {modelo} ---")
-            print(f"Taxa de chegada (λ): {self.lam:.4f}")
-            print(f"Taxa de atendimento por servidor (μ): {self.mi:.4f}")
-            print(f"Número de servidores (s): {self.s}")
-            print(f"Taxa de utilização do sistema (ρ): {self.rho:.4f}")
-            print(f"Probabilidade do sistema estar vazio (P0): {p0:.4f}")
-            print(f"Número médio de clientes no sistema (L): {l:.4f}")
-            print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-            print(f"Tempo médio no sistema (W): {w:.4f} horas ({w*60:.2f} minutos)")
-            print(f"Tempo médio na fila (Wq): {wq:.4f} horas ({wq*60:.2f} minutos)")
+            linhas = [
+                f"--- Modelo {modelo} ---",
+                f"Taxa de chegada (λ): {self.lam:.4f}",
+                f"Taxa de atendimento por servidor (μ): {self.mi:.4f}",
+                f"Número de servidores (s): {self.s}",
+                f"Taxa de utilização do sistema (ρ): {self.rho:.4f}",
+                f"Probabilidade do sistema estar vazio (P0): {p0:.4f}",
+                f"Número médio de clientes no sistema (L): {l:.4f}",
+                f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                f"Tempo médio no sistema (W): {w:.4f} horas ({w*60:.2f} minutos)",
+                f"Tempo médio na fila (Wq): {wq:.4f} horas ({wq*60:.2f} minutos)",
+            ]
+            print("\n".join(linhas), file=file)
             
         except ValueError as e:
             raise e
\ No newline at end of file
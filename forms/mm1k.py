@@ -1,5 +1,4 @@
 import math
-from math import factorial
 
 class Mm1k:
     """
@@ -44,18 +43,23 @@ class Mm1k:
 
         return p0, pk, l, lq, w, wq, lam_efetiva
 
-    def resultado(self):
-        """Exibe os resultados formatados no console."""
-        print(f"--- Modelo M/M/1/K (K={self.k}) ---")
-        print(f"Taxa de tráfego (ρ): {self.rho:.4f}")
+    def resultado(self, file=None):
+        """Exibe os resultados formatados no console (ou em file, se informado)."""
+        linhas = [
+            f"--- Modelo M/M/1/K (K={self.k}) ---",
+            f"Taxa de tráfego (ρ): {self.rho:.4f}",
+        ]
         try:
             p0, pk, l, lq, w, wq, lam_efetiva = self.mm1k()
-            print(f"Probabilidade do sistema estar vazio (P0): {p0:.4f}")
-            print(f"Probabilidade do sistema estar cheio (Pk): {pk:.4f} (Prob. de perda)")
-            print(f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}")
-            print(f"Número médio de clientes no sistema (L): {l:.4f}")
-            print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-            print(f"Tempo médio no sistema (W): {w:.4f}")
-            print(f"Tempo médio na fila (Wq): {wq:.4f}")
+            linhas += [
+                f"Probabilidade do sistema estar vazio (P0): {p0:.4f}",
+                f"Probabilidade do sistema estar cheio (Pk): {pk:.4f} (Prob. de perda)",
+                f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}",
+                f"Número médio de clientes no sistema (L): {l:.4f}",
+                f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                f"Tempo médio no sistema (W): {w:.4f}",
+                f"Tempo médio na fila (Wq): {wq:.4f}",
+            ]
         except ValueError as e:
-            print(e)
\ No newline at end of file
+            linhas.append(str(e))
+        print("\n".join(linhas), file=file)
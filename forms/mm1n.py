@@ -1,6 +1,3 @@
-import math
-from math import factorial
-
 class Mm1n:
     """
     Modelo de Fila M/M/1/N (População Finita N)
@@ -19,10 +16,13 @@ class Mm1n:
         # (Ref: Teoria... MMsK e MMsN... p. 16-17) [cite: 1173, 1176, 1180]
 
         # --- Cálculo de P0 --- [cite: 1173]
+        # Termo N!/(N-n)! * r^n obtido do anterior: evita inteiros enormes de
+        # math.perm, que estouram ao converter para float quando N é grande
         soma_p0 = 0.0
+        termo_n = 1.0
         for n in range(self.n_pop + 1):
-            termo_n = (factorial(self.n_pop) / factorial(self.n_pop - n)) * math.pow(self.r, n)
             soma_p0 += termo_n
+            termo_n *= (self.n_pop - n) * self.r
         p0 = 1 / soma_p0
 
         # --- L (Número médio no sistema) --- [cite: 1180]
@@ -38,16 +38,21 @@ class Mm1n:
         
         return p0, l, lq, w, wq, lam_efetiva
         
-    def resultado(self):
-        """Exibe os resultados formatados no console."""
-        print(f"--- Modelo M/M/1/N (População N={self.n_pop}) ---")
+    def resultado(self, file=None):
+        """Exibe os resultados formatados no console (ou em file, se informado)."""
+        linhas = [
+            f"--- Modelo M/M/1/N (População N={self.n_pop}) ---",
+        ]
         try:
             p0, l, lq, w, wq, lam_efetiva = self.mm1n()
-            print(f"Probabilidade do sistema estar vazio (P0): {p0:.4f}")
-            print(f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}")
-            print(f"Número médio de clientes no sistema (L): {l:.4f}")
-            print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-            print(f"Tempo médio no sistema (W): {w:.4f}")
-            print(f"Tempo médio na fila (Wq): {wq:.4f}")
+            linhas += [
+                f"Probabilidade do sistema estar vazio (P0): {p0:.4f}",
+                f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}",
+                f"Número médio de clientes no sistema (L): {l:.4f}",
+                f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                f"Tempo médio no sistema (W): {w:.4f}",
+                f"Tempo médio na fila (Wq): {wq:.4f}",
+            ]
         except ValueError as e:
-            print(e)
\ No newline at end of file
+            linhas.append(str(e))
+        print("\n".join(linhas), file=file)
@@ -1,5 +1,4 @@
 import math
-from math import factorial
 
 class Mmsk:
     """
@@ -24,29 +23,48 @@ class Mmsk:
         
         # --- Cálculo de P0 --- [cite: 1105]
         # 1/P0 = [ Σ_{n=0}^{s-1} (r^n / n!) ] + [ (r^s / s!) * Σ_{j=0}^{K-s} ρ^j ]
-        soma_p0_1 = 0.0
-        for n in range(self.s):
-            soma_p0_1 += math.pow(self.r, n) / factorial(n)
-            
         soma_p0_2_geometrica = 0.0
         if self.rho == 1.0:
             soma_p0_2_geometrica = self.k - self.s + 1
         else:
             soma_p0_2_geometrica = (1 - math.pow(self.rho, self.k - self.s + 1)) / (1 - self.rho)
-        termo_s = (math.pow(self.r, self.s) / factorial(self.s)) * soma_p0_2_geometrica
-        p0 = 1 / (soma_p0_1 + termo_s)
+
+        # r^s / s! e a soma Σ r^n/n! estouram o float para r grande (P0 = 0 e
+        # produtos inf * 0 = nan). Como em Mm._calc_p0, usa a recursão de Erlang B,
+        # B(m) = r*B(m-1) / (m + r*B(m-1)), sempre em [0, 1]; com E = B(s):
+        #   Σ_{n=0}^{s-1} r^n/n! = (r^s / s!) * (1/E - 1)
+        #   P0 * r^s / s! = E / (1 - E + E * Σ_{j=0}^{K-s} ρ^j)
+        # e P0 sai desse produto dividido por r^s / s! (em escala logarítmica).
+        if self.r == 0:
+            # Sem chegadas: sistema sempre vazio
+            p0 = 1.0
+            p0_r_s_fat = 0.0
+        else:
+            erlang_b = 1.0
+            for m in range(1, self.s + 1):
+                erlang_b = self.r * erlang_b / (m + self.r * erlang_b)
+
+            p0_r_s_fat = erlang_b / (1 - erlang_b + erlang_b * soma_p0_2_geometrica)
+            if p0_r_s_fat > 0:
+                log_r_s_fat = self.s * math.log(self.r) - math.lgamma(self.s + 1)
+                p0 = math.exp(math.log(p0_r_s_fat) - log_r_s_fat)
+            else:
+                # B(s) abaixo do menor float: P0 = 1 / Σ r^n/n! = e^-r na precisão do float
+                p0 = math.exp(-self.r)
         
         # --- Pk (Probabilidade de perda) --- [cite: 1112]
-        # Pk = (r^K / (s! * s^(K-s))) * P0
-        pk = (math.pow(self.r, self.k) / (factorial(self.s) * math.pow(self.s, self.k - self.s))) * p0
+        # Pk = (r^K / (s! * s^(K-s))) * P0 = (r^s / s!) * ρ^(K-s) * P0
+        rho_k_s = math.pow(self.rho, self.k - self.s)  # ρ^(K-s), reutilizado em Lq
+        pk = p0_r_s_fat * rho_k_s
         
         # --- Lq --- [cite: 1118]
         if self.rho == 1.0:
              # Caso especial ρ = 1
-             lq = ( (p0 * math.pow(self.r, self.s)) / factorial(self.s) ) * ( ( (self.k - self.s) * (self.k - self.s + 1) ) / 2 )
+             lq = p0_r_s_fat * ( ( (self.k - self.s) * (self.k - self.s + 1) ) / 2 )
         else:
-            fator_comum = (p0 * math.pow(self.r, self.s) * self.rho) / (factorial(self.s) * math.pow(1 - self.rho, 2))
-            termo_chaves = 1 - math.pow(self.rho, self.k - self.s) - (self.k - self.s) * math.pow(self.rho, self.k - self.s) * (1 - self.rho)
+            um_menos_rho = 1 - self.rho
+            fator_comum = (p0_r_s_fat * self.rho) / (um_menos_rho * um_menos_rho)
+            termo_chaves = 1 - rho_k_s - (self.k - self.s) * rho_k_s * um_menos_rho
             lq = fator_comum * termo_chaves
 
         # --- Outras métricas --- [cite: 1119, 1120, 1124]
@@ -57,18 +75,23 @@ class Mmsk:
 
         return p0, pk, l, lq, w, wq, lam_efetiva
 
-    def resultado(self):
-        """Exibe os resultados formatados no console."""
-        print(f"--- Modelo M/M/{self.s}/K (K={self.k}) ---")
-        print(f"Taxa de tráfego (ρ): {self.rho:.4f} (r = {self.r:.4f})")
+    def resultado(self, file=None):
+        """Exibe os resultados formatados no console (ou em file, se informado)."""
+        linhas = [
+            f"--- Modelo M/M/{self.s}/K (K={self.k}) ---",
+            f"Taxa de tráfego (ρ): {self.rho:.4f} (r = {self.r:.4f})",
+        ]
         try:
             p0, pk, l, lq, w, wq, lam_efetiva = self.mmsk()
-            print(f"Probabilidade do sistema estar vazio (P0): {p0:.4f}")
-            print(f"Probabilidade do sistema estar cheio (Pk): {pk:.4f} (Prob. de perda)")
-            print(f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}")
-            print(f"Número médio de clientes no sistema (L): {l:.4f}")
-            print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-            print(f"Tempo médio no sistema (W): {w:.4f}")
-            print(f"Tempo médio na fila (Wq): {wq:.4f}")
+            linhas += [
+                f"Probabilidade do sistema estar vazio (P0): {p0:.4f}",
+                f"Probabilidade do sistema estar cheio (Pk): {pk:.4f} (Prob. de perda)",
+                f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}",
+                f"Número médio de clientes no sistema (L): {l:.4f}",
+                f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                f"Tempo médio no sistema (W): {w:.4f}",
+                f"Tempo médio na fila (Wq): {wq:.4f}",
+            ]
         except ValueError as e:
-            print(e)
+            linhas.append(str(e))
+        print("\n".join(linhas), file=file)
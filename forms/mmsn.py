@@ -1,5 +1,32 @@
 import math
-from math import factorial
+
+
+def termos_mmsn(n_pop, s, r):
+    """
+    Termos c_n = P_n / P0 do modelo M/M/s/N, para n = 0..N, divididos pelo maior
+    deles (a normalização em mmsn não muda).
+
+    c_n = C(N, n) * r^n                         (n < s)
+    c_n = N! / ((N-n)! * s! * s^(n-s)) * r^n    (n >= s)
+
+    Ambos seguem a recorrência c_n = c_{n-1} * (N-n+1) * r / min(n, s), com
+    c_0 = 1, aplicada em escala logarítmica: os c_n estouram o float para
+    populações grandes (soma inf, P0 = 0 e Pn = inf * 0 = nan), enquanto
+    c_n / max(c) fica sempre em [0, 1].
+    """
+    if r == 0:
+        # Sem chegadas: toda a probabilidade em n = 0
+        return [1.0] + [0.0] * n_pop
+
+    log_r = math.log(r)
+    logs = [0.0]
+    log_termo = 0.0
+    for n in range(1, n_pop + 1):
+        log_termo += math.log((n_pop - n + 1) / min(n, s)) + log_r
+        logs.append(log_termo)
+    maior = max(logs)
+    return [math.exp(v - maior) for v in logs]
+
 
 class Mmsn:
     """
@@ -24,39 +51,16 @@ class Mmsn:
         # (Ref: Teoria... MMsK e MMsN... p. 21-22) [cite: 1218, 1224, 1229, 1230, 1231, 1232]
 
         # --- Cálculo de P0 --- [cite: 1218]
-        soma_p0_1 = 0.0
-        for n in range(self.s):
-            comb = factorial(self.n_pop) / (factorial(self.n_pop - n) * factorial(n))
-            termo_n = comb * math.pow(self.r, n)
-            soma_p0_1 += termo_n
+        # 1/P0 = Σ_{n=0}^{N} c_n, com c_n = P_n / P0; os termos vêm divididos
+        # por max(c), então Pn = termo_n / Σ termos
+        termos = termos_mmsn(self.n_pop, self.s, self.r)
+        soma = math.fsum(termos)
 
-        soma_p0_2 = 0.0
-        for n in range(self.s, self.n_pop + 1):
-            fator_comb = factorial(self.n_pop) / (factorial(self.n_pop - n) * factorial(self.s))
-            fator_pot = math.pow(self.s, n - self.s)
-            termo_n = (fator_comb / fator_pot) * math.pow(self.r, n)
-            soma_p0_2 += termo_n
-        p0 = 1 / (soma_p0_1 + soma_p0_2)
-        
-        self.p_list = [p0]
-        l = 0.0
-        
         # --- L (Número médio no sistema) --- [cite: 1231]
-        # L = Σ_{n=1}^{N} n * Pn
-        # Pn para n < s (1 <= n <= s-1) [cite: 1224]
-        for n in range(1, self.s):
-            comb = factorial(self.n_pop) / (factorial(self.n_pop - n) * factorial(n))
-            pn = comb * math.pow(self.r, n) * p0
-            self.p_list.append(pn)
-            l += n * pn
-            
-        # Pn para n >= s (s <= n <= N) [cite: 1224]
-        for n in range(self.s, self.n_pop + 1):
-            fator_comb = factorial(self.n_pop) / (factorial(self.n_pop - n) * factorial(self.s))
-            fator_pot = math.pow(self.s, n - self.s)
-            pn = (fator_comb / fator_pot) * math.pow(self.r, n) * p0
-            self.p_list.append(pn)
-            l += n * pn
+        # L = Σ_{n=1}^{N} n * Pn [cite: 1224]
+        self.p_list = [c / soma for c in termos]
+        p0 = self.p_list[0]
+        l = math.fsum(n * pn for n, pn in enumerate(self.p_list))
 
         # --- Outras métricas --- [cite: 1229, 1230, 1232]
         lam_efetiva = self.lam_por_cliente * (self.n_pop - l) # [cite: 1230]
@@ -66,16 +70,21 @@ class Mmsn:
         
         return p0, l, lq, w, wq, lam_efetiva
 
-    def resultado(self):
-        """Exibe os resultados formatados no console."""
-        print(f"--- Modelo M/M/{self.s}/N (População N={self.n_pop}) ---")
+    def resultado(self, file=None):
+        """Exibe os resultados formatados no console (ou em file, se informado)."""
+        linhas = [
+            f"--- Modelo M/M/{self.s}/N (População N={self.n_pop}) ---",
+        ]
         try:
             p0, l, lq, w, wq, lam_efetiva = self.mmsn()
-            print(f"Probabilidade do sistema estar vazio (P0): {p0:.4f}")
-            print(f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}")
-            print(f"Número médio de clientes no sistema (L): {l:.4f}")
-            print(f"Número médio de clientes na fila (Lq): {lq:.4f}")
-            print(f"Tempo médio no sistema (W): {w:.4f}")
-            print(f"Tempo médio na fila (Wq): {wq:.4f}")
+            linhas += [
+                f"Probabilidade do sistema estar vazio (P0): {p0:.4f}",
+                f"Taxa de chegada efetiva (λ_barra): {lam_efetiva:.4f}",
+                f"Número médio de clientes no sistema (L): {l:.4f}",
+                f"Número médio de clientes na fila (Lq): {lq:.4f}",
+                f"Tempo médio no sistema (W): {w:.4f}",
+                f"Tempo médio na fila (Wq): {wq:.4f}",
+            ]
         except ValueError as e:
-            print(e)
\ No newline at end of file
+            linhas.append(str(e))
+        print("\n".join(linhas), file=file)
@@ -1,4 +1,5 @@
-from math import factorial
+import math
+from functools import lru_cache
 
 
 '''
@@ -36,6 +37,27 @@ def arredondar(valor, casas=6):
         return [arredondar(v, casas) for v in valor]
     return valor
 
+# Probabilidade de espera (Erlang C), memoizada por (λ, µ, s)
+# Os termos a^k / k! são obtidos incrementalmente (termo *= a / k),
+# evitando recalcular potências e fatoriais a cada iteração
+@lru_cache(maxsize=4096)
+def erlang_c(lambd, mi, s):
+    # Sistema saturado (ρ = λ / sµ >= 1): todo cliente espera
+    if lambd >= s * mi:
+        return 1.0
+
+    a = lambd / mi
+    termo = 1.0  # a^0 / 0!
+    termos = []
+    for k in range(1, s + 1):
+        termos.append(termo)
+        termo *= a / k
+    # Ao fim do laço, termo = a^s / s!
+    # fsum soma com compensação de erro, preservando a precisão de P0 para s grande
+    soma_termos = math.fsum(termos)
+    last_term = termo * (s * mi) / (s * mi - lambd)
+    return last_term / (soma_termos + last_term)
+
 # Função principal do modelo com prioridade e interrupção
 def mms_prioridade_com_interrupcao(lambdas_, mi, servidores):
     # Validação básica
@@ -46,7 +68,7 @@ def mms_prioridade_com_interrupcao(lambdas_, mi, servidores):
     if any(l < 0 for l in lambdas_):
         return {"Erro": "Taxas de chegada devem ser maiores ou iguais a zero"}
 
-    lambdas_total = sum(lambdas_)
+    lambdas_total = math.fsum(lambdas_)
     capacidade = mi * servidores
     rho = lambdas_total / capacidade
 
@@ -57,9 +79,10 @@ def mms_prioridade_com_interrupcao(lambdas_, mi, servidores):
 
     # Para o caso s = 1
     if servidores == 1:
+        # Somas acumuladas de λ mantidas de uma classe para a próxima (O(n) no total)
+        soma_lambdas_i_menos_1 = 0.0
         for i, lam_i in enumerate(lambdas_):
-            soma_lambdas = sum(lambdas_[j] for j in range(i + 1))
-            soma_lambdas_i_menos_1 = sum(lambdas_[j] for j in range(i)) if i > 0 else 0.0
+            soma_lambdas = soma_lambdas_i_menos_1 + lam_i
 
             denom = (1.0 - (soma_lambdas_i_menos_1 / mi)) * (1.0 - (soma_lambdas / mi))
 
@@ -81,32 +104,27 @@ def mms_prioridade_com_interrupcao(lambdas_, mi, servidores):
                 "\n    Tempo médio gasto na fila (Wq)": Wq,
             }
 
+            soma_lambdas_i_menos_1 = soma_lambdas
+
     # Para o caso s > 1
     else:
-        def Pw(lambd, mi, s):
-            a = lambd / mi
-            sum_terms = sum((a ** k) / factorial(k) for k in range(s))
-            last_term = (a ** s / factorial(s)) * (s * mi) / (s * mi - lambd)
-            if s * mi - lambd <= 0:
-                return {"Erro": "Denominador inválido no cálculo de Pw. Verifique os dados de λ e µ."}
-            return last_term / (sum_terms + last_term)
-
-        Ws = []
+        # Acumuladores de Σ λ_j e Σ λ_j * W_j das classes já processadas
+        soma_lambdas = 0.0
+        soma_previas = 0.0
 
         for i, lam_i in enumerate(lambdas_):
-            soma_lambdas = sum(lambdas_[j] for j in range(i + 1))
+            soma_lambdas += lam_i
 
-            Pw_bar = Pw(soma_lambdas, mi, servidores)
+            Pw_bar = erlang_c(soma_lambdas, mi, servidores)
             Wq_bar = Pw_bar / (servidores * mi - soma_lambdas)
             W_bar = Wq_bar + 1.0 / mi
 
             if i == 0:
                 W = W_bar
             else:
-                soma_previas = sum(lambdas_[j] * Ws[j] for j in range(i))
                 W = (soma_lambdas * W_bar - soma_previas) / lam_i
 
-            Ws.append(W)
+            soma_previas += lam_i * W
 
             Wq = W - 1.0 / mi
 
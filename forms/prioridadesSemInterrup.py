@@ -28,6 +28,14 @@ def arredondar(valor, casas=6):
         return [arredondar(v, casas) for v in valor]
     return valor
 
+# Tabela de fatoriais (0!, 1!, 2!, ...), estendida sob demanda
+_FATORIAIS = [1]
+
+def _fatorial(n):
+    while len(_FATORIAIS) <= n:
+        _FATORIAIS.append(_FATORIAIS[-1] * len(_FATORIAIS))
+    return _FATORIAIS[n]
+
 # Função principal do modelo com prioridade sem interrupção
 def mms_prioridade_sem_interrupcao(lambdas_, mi, servidores):
     # Validações básicas
@@ -38,7 +46,7 @@ def mms_prioridade_sem_interrupcao(lambdas_, mi, servidores):
     if any(l < 0 for l in lambdas_):
         return {"Erro": "Taxas de chegada (λi) devem ser maiores ou iguais a zero"}
 
-    lambda_total = sum(lambdas_)
+    lambda_total = math.fsum(lambdas_)
     capacidade = servidores * mi
     rho = lambda_total / capacidade
 
@@ -48,18 +56,22 @@ def mms_prioridade_sem_interrupcao(lambdas_, mi, servidores):
     r = lambda_total / mi
     s = servidores
 
+    # r^j acumulado por multiplicação sucessiva; ao fim do laço vale r^s
     soma_r = 0.0
+    r_pow_j = 1.0
     for j in range(s):
-        soma_r += (r ** j) / math.factorial(j)
+        soma_r += r_pow_j / _fatorial(j)
+        r_pow_j *= r
 
-    r_pow_s = r ** s
+    r_pow_s = r_pow_j
 
-    termo = (math.factorial(s) * (s * mi - lambda_total) / r_pow_s) * soma_r + s * mi
+    termo = (_fatorial(s) * (s * mi - lambda_total) / r_pow_s) * soma_r + s * mi
 
     resultados = {}
 
+    # Σ λ das classes anteriores, acumulada ao longo do laço (O(n) no total)
+    soma_i_menos_1 = 0.0
     for k, lambda_k in enumerate(lambdas_):
-        soma_i_menos_1 = sum(lambdas_[:k])
         soma_i = soma_i_menos_1 + lambda_k
 
         termo2 = 1.0 - soma_i_menos_1 / capacidade
@@ -82,6 +94,8 @@ def mms_prioridade_sem_interrupcao(lambdas_, mi, servidores):
             "\n    Tempo médio gasto na fila (Wq)": Wq,
         }
 
+        soma_i_menos_1 = soma_i
+
     return arredondar(resultados)
 
 